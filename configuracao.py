@@ -108,6 +108,10 @@ class Configuracao:
     })
 
     # Configurações de veículos
+    # ATENÇÃO: veiculo.py copia no import ALTURA_VEICULO, VELOCIDADE_MIN/MAX_VEICULO,
+    # ACELERACAO_VEICULO, DESACELERACAO_VEICULO, DESACELERACAO_EMERGENCIA,
+    # DISTANCIA_MIN_VEICULO, DISTANCIA_REACAO e CORES_VEICULO. Alterá-los depois do import
+    # não afeta os veículos: ajuste-os antes de importar veiculo.py.
     LARGURA_VEICULO: int = 25
     ALTURA_VEICULO: int = 35
     TAXA_GERACAO_VEICULO: float = 0.012
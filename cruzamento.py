@@ -78,16 +78,6 @@ class Cruzamento:
         for semaforo in semaforos.values():
             self.gerenciador_semaforos.adicionar_semaforo(semaforo)
 
-    # ---------- helpers de faixa ----------
-    def _centro_faixa(self, direcao: Direcao, idx: int) -> Tuple[float, float]:
-        idx = max(0, min(idx, CONFIG.FAIXAS_POR_VIA - 1))
-        if direcao == Direcao.LESTE:
-            y = self.centro_y - CONFIG.LARGURA_RUA / 2 + (idx + 0.5) * CONFIG.LARGURA_FAIXA
-            return (None, y)
-        else:
-            x = self.centro_x - CONFIG.LARGURA_RUA / 2 + (idx + 0.5) * CONFIG.LARGURA_FAIXA
-            return (x, None)
-
     # ---------- geração + BACKLOG ----------
     def pode_gerar_veiculo(self, direcao: Direcao) -> bool:
         if direcao not in CONFIG.DIRECOES_PERMITIDAS:
@@ -115,15 +105,15 @@ class Cruzamento:
 
     def _tentar_spawn(self, direcao: Direcao, faixa: int) -> Veiculo | None:
         """Tenta criar 1 veículo na faixa informada se houver espaço."""
+        # o centro da faixa vem de Veiculo._lane_center_coord, a mesma conta que fixa a
+        # lateral do veículo (a via de NORTE é a coluna do cruzamento; a de LESTE, a linha)
+        linha, coluna = self.id
         if direcao == Direcao.NORTE:
-            x, _ = self._centro_faixa(Direcao.NORTE, faixa)
-            posicao = (x, -50)
+            posicao = (Veiculo._lane_center_coord(Direcao.NORTE, coluna, faixa), -50)
         else:
-            _, y = self._centro_faixa(Direcao.LESTE, faixa)
-            posicao = (-50, y)
+            posicao = (-50, Veiculo._lane_center_coord(Direcao.LESTE, linha, faixa))
         if self._tem_espaco_para_gerar(direcao, posicao, faixa):
-            v = Veiculo(direcao, posicao, self.id)
-            v.indice_faixa = faixa
+            v = Veiculo(direcao, posicao, self.id, faixa)
             self.veiculos_por_direcao[direcao].append(v)
             return v
         return None
@@ -170,7 +160,7 @@ class Cruzamento:
 
     def _tem_espaco_para_gerar(self, direcao, posicao, faixa) -> bool:
         for v in self.veiculos_por_direcao.get(direcao, []):
-            if getattr(v, "indice_faixa", 0) != faixa:
+            if v.indice_faixa != faixa:
                 continue
             dx = abs(v.posicao[0] - posicao[0])
             dy = abs(v.posicao[1] - posicao[1])
@@ -182,29 +172,23 @@ class Cruzamento:
                     return False
         return True
 
-    def _determinar_cruzamento_veiculo(self, veiculo: Veiculo) -> Tuple[int, int]:
-        coluna = int((veiculo.posicao[0] - CONFIG.POSICAO_INICIAL_X + CONFIG.ESPACAMENTO_HORIZONTAL / 2) /
-                     CONFIG.ESPACAMENTO_HORIZONTAL)
-        linha = int((veiculo.posicao[1] - CONFIG.POSICAO_INICIAL_Y + CONFIG.ESPACAMENTO_VERTICAL / 2) /
-                    CONFIG.ESPACAMENTO_VERTICAL)
+    @staticmethod
+    def _determinar_cruzamento_veiculo(veiculo: Veiculo) -> Tuple[int, int]:
+        # OTIMIZAÇÃO: ESPACAMENTO_* e POSICAO_INICIAL_* são properties (recalculadas a
+        # cada acesso); lê cada uma uma vez por chamada
+        esp_h = CONFIG.ESPACAMENTO_HORIZONTAL
+        esp_v = CONFIG.ESPACAMENTO_VERTICAL
+        coluna = int((veiculo.posicao[0] - CONFIG.POSICAO_INICIAL_X + esp_h / 2) / esp_h)
+        linha = int((veiculo.posicao[1] - CONFIG.POSICAO_INICIAL_Y + esp_v / 2) / esp_v)
         coluna = max(0, min(coluna, CONFIG.COLUNAS_GRADE - 1))
         linha = max(0, min(linha, CONFIG.LINHAS_GRADE - 1))
         return (linha, coluna)
 
-    def _veiculo_proximo_ao_cruzamento(self, veiculo: Veiculo) -> bool:
-        distancia_limite_horizontal = CONFIG.ESPACAMENTO_HORIZONTAL * 0.7
-        distancia_limite_vertical = CONFIG.ESPACAMENTO_VERTICAL * 0.7
-        dx = abs(veiculo.posicao[0] - self.centro_x)
-        dy = abs(veiculo.posicao[1] - self.centro_y)
-        return dx < distancia_limite_horizontal or dy < distancia_limite_vertical
-
     def _veiculo_antes_da_linha(self, veiculo: Veiculo, posicao_parada: Tuple[float, float]) -> bool:
-        margem = CONFIG.DISTANCIA_DETECCAO_SEMAFORO
-        if veiculo.direcao == Direcao.NORTE:
-            return veiculo.posicao[1] < posicao_parada[1] + margem
-        elif veiculo.direcao == Direcao.LESTE:
-            return veiculo.posicao[0] < posicao_parada[0] + margem
-        return False
+        # OTIMIZAÇÃO: só chegam aqui veículos NORTE/LESTE (DIRECOES_PERMITIDAS, filtrado no
+        # passo 2 de atualizar_veiculos); o eixo longitudinal do veículo substitui o if por direção
+        eixo = veiculo._eixo
+        return veiculo.posicao[eixo] < posicao_parada[eixo] + CONFIG.DISTANCIA_DETECCAO_SEMAFORO
 
     def _ordenar_veiculos_por_posicao(self, veiculos: List[Veiculo], direcao: Direcao) -> List[Veiculo]:
         if direcao == Direcao.NORTE:
@@ -222,16 +206,29 @@ class Cruzamento:
     # =========================
     # ATUALIZAÇÃO (com anticolisão H×V + faixas)
     # =========================
-    def atualizar_veiculos(self, todos_veiculos: List[Veiculo]) -> None:
-        """Atualiza o estado dos veículos no cruzamento, com lock de interseção por direção."""
+    def atualizar_veiculos(self, todos_veiculos: List[Veiculo],
+                           candidatos: Optional[List[Veiculo]] = None) -> None:
+        """
+        Atualiza o estado dos veículos no cruzamento, com lock de interseção por direção.
+        `candidatos` (partição feita pela MalhaViaria) evita varrer a frota inteira.
+        """
         # 1) Limpa listas antigas deste cruzamento
         for direcao in CONFIG.DIRECOES_PERMITIDAS:
             self.veiculos_por_direcao[direcao] = []
 
         # 2) Reclassifica veículos deste cruzamento
+        # OTIMIZAÇÃO: CONFIG (inclusive as properties de espaçamento) lido uma vez por chamada
+        direcoes_permitidas = CONFIG.DIRECOES_PERMITIDAS
+        limite_horizontal = CONFIG.ESPACAMENTO_HORIZONTAL * 0.7
+        limite_vertical = CONFIG.ESPACAMENTO_VERTICAL * 0.7
+        centro_x, centro_y = self.centro_x, self.centro_y
         veiculos_proximos: List[Veiculo] = []
-        for v in todos_veiculos:
-            if v.direcao in CONFIG.DIRECOES_PERMITIDAS and self._veiculo_proximo_ao_cruzamento(v):
+        for v in (todos_veiculos if candidatos is None else candidatos):
+            if v.direcao not in direcoes_permitidas:
+                continue
+            x, y = v.posicao
+            # veículo próximo ao cruzamento
+            if abs(x - centro_x) < limite_horizontal or abs(y - centro_y) < limite_vertical:
                 c_id = self._determinar_cruzamento_veiculo(v)
                 if c_id == self.id:
                     v.resetar_controle_semaforo(self.id)
@@ -266,16 +263,18 @@ class Cruzamento:
             veics_ordenados = self._ordenar_veiculos_por_posicao(veics, direcao)
             semaforo = semaforos.get(direcao, None)
             oposta = Direcao.LESTE if direcao == Direcao.NORTE else Direcao.NORTE
+            # Posição da linha de parada (se houver semáforo).
+            # OTIMIZAÇÃO: é a mesma para toda a fila desta direção; calcula uma vez
+            pos_parada = semaforo.obter_posicao_parada() if semaforo else None
 
             for v in veics_ordenados:
                 # Car-following global
-                v.processar_todos_veiculos(todos_veiculos)
+                v.processar_todos_veiculos(todos_veiculos, self.malha)
 
-                # Posição da linha de parada (se houver semáforo)
-                pos_parada = semaforo.obter_posicao_parada() if semaforo else None
-
-                # Estado antes de atualizar (para detectar entrada/saída da caixa)
-                estava_dentro = dentro_intersec(v)
+                # Estado antes de atualizar (para detectar entrada/saída da caixa).
+                # OTIMIZAÇÃO: reaproveita o teste do passo 3 — o veículo ainda não se moveu
+                # longitudinalmente e a troca de faixa só o desloca dentro da própria via.
+                estava_dentro = v.no_cruzamento
                 antes_da_linha = False
                 if semaforo and pos_parada is not None:
                     # Só "antes da linha" se ainda não entrou no box
@@ -330,6 +329,8 @@ class MalhaViaria:
         self.linhas = linhas
         self.colunas = colunas
         self.veiculos: List[Veiculo] = []
+        # baldes (direção, via, faixa) -> veículos, reconstruídos a cada frame
+        self._veiculos_por_faixa: Dict[Tuple[Direcao, int, int], List[Veiculo]] = {}
         self.cruzamentos: Dict[Tuple[int, int], Cruzamento] = {}
         self.gerenciador_semaforos = GerenciadorSemaforos(
             CONFIG.HEURISTICA_ATIVA, engine,
@@ -369,9 +370,13 @@ class MalhaViaria:
         self.caos_vertical: Dict[int, List[float]] = {
             coluna: [1.0] * self._caos_seg_v for coluna in range(self.colunas)
         }
+        # PERF: False até algum fator mutar (e sempre que o caos é desligado);
+        # os veículos pulam obter_fator_caos nesse caso
+        self.caos_ativo = False
 
     def atualizar_caos(self) -> None:
         if not CONFIG.CHAOS_ATIVO:
+            self.caos_ativo = False
             return
         p = CONFIG.CHAOS_PROB_MUTACAO
         fmin, fmax = CONFIG.CHAOS_FATOR_MIN, CONFIG.CHAOS_FATOR_MAX
@@ -380,11 +385,13 @@ class MalhaViaria:
             for i in range(len(v)):
                 if random.random() < p:
                     v[i] = random.uniform(fmin, fmax)
+                    self.caos_ativo = True
         for coluna in range(self.colunas):
             v = self.caos_vertical[coluna]
             for i in range(len(v)):
                 if random.random() < p:
                     v[i] = random.uniform(fmin, fmax)
+                    self.caos_ativo = True
 
     def obter_fator_caos(self, veiculo: Veiculo) -> float:
         if not CONFIG.CHAOS_ATIVO:
@@ -420,19 +427,11 @@ class MalhaViaria:
     def _construir_vizinhos_por_faixa(self) -> None:
         buckets = {}
 
-        def via_idx_de(v: Veiculo) -> int:
-            if v.direcao == Direcao.LESTE:
-                idx = round((v.posicao[1] - CONFIG.POSICAO_INICIAL_Y) / CONFIG.ESPACAMENTO_VERTICAL)
-                return max(0, min(idx, self.linhas - 1))
-            else:
-                idx = round((v.posicao[0] - CONFIG.POSICAO_INICIAL_X) / CONFIG.ESPACAMENTO_HORIZONTAL)
-                return max(0, min(idx, self.colunas - 1))
-
         for v in self.veiculos:
             if not v.ativo:
                 continue
-            faixa = getattr(v, "indice_faixa", 0)
-            key = (v.direcao, via_idx_de(v), faixa)
+            # mesma definição de via usada por Veiculo._mesma_via_mesma_faixa
+            key = (v.direcao, v._via, v.indice_faixa)
             longpos = v.posicao[0] if v.direcao == Direcao.LESTE else v.posicao[1]
             buckets.setdefault(key, []).append((longpos, v))
 
@@ -441,12 +440,57 @@ class MalhaViaria:
             v._leader_cache = None
             v._follower_cache = None
 
+        por_faixa = {}
         for key, arr in buckets.items():
             arr.sort(key=lambda t: t[0])  # crescente
             n = len(arr)
             for i, (_, v) in enumerate(arr):
                 v._leader_cache = arr[i + 1][1] if i + 1 < n else None
                 v._follower_cache = arr[i - 1][1] if i - 1 >= 0 else None
+            por_faixa[key] = [v for _, v in arr]
+        self._veiculos_por_faixa = por_faixa
+
+    def _atualizar_cruzamentos(self) -> None:
+        """
+        PERF: particiona a frota por cruzamento uma vez por frame em vez de cada
+        cruzamento varrer todos os veículos (O(N) por frame em vez de O(N·C)).
+
+        Quem cruza a fronteira para um cruzamento ainda não processado neste frame
+        é repassado a ele, exatamente como acontecia quando cada cruzamento
+        reclassificava a frota toda.
+        """
+        ordem = {c_id: k for k, c_id in enumerate(self.cruzamentos)}
+        grupos: Dict[Tuple[int, int], List[Tuple[int, Veiculo]]] = {c_id: [] for c_id in self.cruzamentos}
+        for i, v in enumerate(self.veiculos):
+            grupo = grupos.get(Cruzamento._determinar_cruzamento_veiculo(v))
+            if grupo is not None:
+                grupo.append((i, v))
+
+        fora_de_ordem = set()
+        for c_id, cruzamento in self.cruzamentos.items():
+            grupo = grupos[c_id]
+            if c_id in fora_de_ordem:
+                grupo.sort(key=lambda t: t[0])  # mantém a ordem da frota (desempate do sort estável)
+            cruzamento.atualizar_veiculos(self.veiculos, [v for _, v in grupo])
+
+            k = ordem[c_id]
+            for item in grupo:
+                novo_id = Cruzamento._determinar_cruzamento_veiculo(item[1])
+                if novo_id != c_id and novo_id in grupos and ordem[novo_id] > k:
+                    grupos[novo_id].append(item)
+                    fora_de_ordem.add(novo_id)
+
+    def veiculos_na_faixa(self, direcao: Direcao, via: int, faixa: int) -> List[Veiculo]:
+        """Veículos (ativos no início do frame) de uma faixa; substitui a varredura O(N) da frota."""
+        return self._veiculos_por_faixa.get((direcao, via, faixa), [])
+
+    def registrar_troca_faixa(self, veiculo: Veiculo, faixa_antiga: int) -> None:
+        """Move o veículo para o balde da nova faixa, mantendo as consultas exatas no mesmo frame."""
+        via = veiculo._via
+        antigos = self._veiculos_por_faixa.get((veiculo.direcao, via, faixa_antiga))
+        if antigos is not None and veiculo in antigos:
+            antigos.remove(veiculo)
+        self._veiculos_por_faixa.setdefault((veiculo.direcao, via, veiculo.indice_faixa), []).append(veiculo)
 
     # ---- helpers para métricas instantâneas ----
     @staticmethod
@@ -505,21 +549,7 @@ class MalhaViaria:
         self._construir_vizinhos_por_faixa()
 
         # Atualiza cruzamentos
-        for cruzamento in self.cruzamentos.values():
-            cruzamento.atualizar_veiculos(self.veiculos)
-
-        # ---- NOVO: detectar início de parada (para contar "paradas") ----
-        # Regra: conta quando transita de "em movimento" -> "parado".
-        # Critério de parado: speed <= 1e-3 OU atributo v.parado True
-        for v in self.veiculos:
-            if not v.ativo:
-                continue
-            speed = self._speed_of(v)
-            moving = speed > 1e-3 and not getattr(v, 'parado', False)
-            was_moving = getattr(v, '_was_moving', True)
-            if was_moving and not moving:
-                v._stop_count = getattr(v, '_stop_count', 0) + 1
-            v._was_moving = moving
+        self._atualizar_cruzamentos()
 
         # Coleta densidade para heurísticas
         densidade_por_cruzamento = {}
@@ -529,10 +559,20 @@ class MalhaViaria:
         # Atualiza semáforos e verifica se precisa aguardar o LLM
         is_waiting_for_llm = self.gerenciador_semaforos.atualizar(densidade_por_cruzamento)
 
-        # Remove veículos inativos e coleta métricas
+        # Remove veículos inativos e coleta métricas.
+        # PERF: a contagem de paradas vai no mesmo laço (uma passada pela frota por frame);
+        # os semáforos acima não leem nem alteram o estado dos veículos.
         veiculos_ativos = []
         for veiculo in self.veiculos:
             if veiculo.ativo:
+                # ---- NOVO: detectar início de parada (para contar "paradas") ----
+                # Regra: conta quando transita de "em movimento" -> "parado".
+                # Critério de parado: speed <= 1e-3 OU atributo v.parado True
+                # PERF: campos sempre presentes em Veiculo; sem sondagem getattr/hasattr por frame
+                moving = veiculo.velocidade > 1e-3 and not veiculo.parado
+                if veiculo._was_moving and not moving:
+                    veiculo._stop_count += 1
+                veiculo._was_moving = moving
                 veiculos_ativos.append(veiculo)
             else:
                 self.metricas['veiculos_concluidos'] += 1
@@ -540,8 +580,7 @@ class MalhaViaria:
                 self.metricas['tempo_parado_total'] += veiculo.tempo_parado
                 # ---- NOVO: guardar dados para percentis e paradas ----
                 self._tempos_viagem_concluidos_s.append(veiculo.tempo_viagem / CONFIG.FPS)
-                self._paradas_total_concluidos += int(getattr(veiculo, '_stop_count',
-                                                              getattr(veiculo, 'numero_paradas', 0)))
+                self._paradas_total_concluidos += veiculo._stop_count
                 self._paradas_veiculos_concluidos += 1
 
         self.veiculos = veiculos_ativos
@@ -3,12 +3,18 @@ Módulo de renderização aprimorado para a simulação de malha viária urbana.
 Centraliza todas as responsabilidades visuais do sistema.
 """
 import pygame
+from collections import OrderedDict
 from typing import Dict, List, Tuple
 from configuracao import CONFIG, Direcao, EstadoSemaforo
 from cruzamento import MalhaViaria, Cruzamento
 from veiculo import Veiculo
 from semaforo import Semaforo
 
+# Limite do cache de textos de debug por veículo
+_MAX_TEXTO_DEBUG_CACHE = 512
+# Texto de debug por veículo é refeito a cada N frames (~5 Hz em qualquer FPS)
+_QUADROS_ATUALIZACAO_DEBUG = max(1, CONFIG.FPS // 5)
+
 
 class Renderizador:
     """Sistema de renderização com interface aprimorada."""
@@ -28,6 +34,9 @@ class Renderizador:
             'media': pygame.font.SysFont('Arial', CONFIG.TAMANHO_FONTE_MEDIA),
             'grande': pygame.font.SysFont('Arial', CONFIG.TAMANHO_FONTE_GRANDE),  # <-- aqui estava SysSysFont
             'titulo': pygame.font.SysFont('Arial', 28, bold=True),
+            # debug: criadas uma vez aqui em vez de a cada veículo/cruzamento por frame
+            'debug_veiculo': pygame.font.SysFont('Arial', 10),
+            'debug_cruzamento': pygame.font.SysFont('Arial', 12),
         }
 
         # Superfícies / caches
@@ -38,12 +47,17 @@ class Renderizador:
         self._ruas_cache = None
         self._ruas_cache_key = None
 
-        self._sprite_cache = {}  # (direcao, cor) -> Surface
+        self._sprite_cache = {}  # (direcao, cor, freando) -> (Surface, meia largura, meia altura)
         self._painel_cache = None
         
         # CACHES ADICIONAIS
         self._painel_superior_cache = None
         self._controles_cache = None
+        # texto de debug por veículo já renderizado (LRU limitado; o texto muda devagar)
+        self._texto_debug_cache: 'OrderedDict[str, pygame.Surface]' = OrderedDict()
+        # id do veículo -> superfície exibida até a próxima atualização do debug
+        self._debug_por_veiculo: Dict[int, pygame.Surface] = {}
+        self._quadros_debug = 0
 
     @staticmethod
     def _linha_tracejada(surface, cor, start_pos, end_pos, dash_length=14, gap_length=10, width=2):
@@ -295,8 +309,7 @@ class Renderizador:
         for cruzamento in malha.cruzamentos.values():
             self.desenhar_cruzamento(tela, cruzamento)
 
-        for veiculo in malha.veiculos:
-            self.desenhar_veiculo(tela, veiculo)
+        self.desenhar_veiculos(tela, malha.veiculos)
 
     def _desenhar_ruas(self, tela: pygame.Surface, malha: MalhaViaria) -> None:
         """Desenha as ruas da malha com múltiplas faixas, setas e (opcional) overlay do CAOS."""
@@ -387,7 +400,7 @@ class Renderizador:
                          largura_linha)
 
     def _desenhar_info_debug_cruzamento(self, tela: pygame.Surface, cruzamento: Cruzamento) -> None:
-        fonte = pygame.font.SysFont('Arial', 12)
+        fonte = self.fontes['debug_cruzamento']
         texto = f"C({cruzamento.id[0]},{cruzamento.id[1]}) D:{cruzamento.estatisticas['densidade_atual']}"
         superficie = fonte.render(texto, True, CONFIG.BRANCO)
         tela.blit(superficie, (cruzamento.centro_x - 30, cruzamento.centro_y - 10))
@@ -464,59 +477,86 @@ class Renderizador:
     # ========================================
     # RENDERIZAÇÃO DE VEÍCULOS (com sprite cache)
     # ========================================
-    def _sprite_veiculo(self, direcao: Direcao, cor: Tuple[int, int, int], w: int, h: int) -> pygame.Surface:
-        key = (direcao, cor)
-        spr = self._sprite_cache.get(key)
-        if spr:
-            return spr
+    def _sprite_veiculo(self, direcao: Direcao, cor: Tuple[int, int, int], freando: bool,
+                        w: int, h: int) -> Tuple[pygame.Surface, int, int]:
+        # OTIMIZAÇÃO: faróis e luzes de freio vão no próprio sprite; cada veículo vira um único blit
+        key = (direcao, cor, freando)
+        entrada = self._sprite_cache.get(key)
+        if entrada:
+            return entrada
         if direcao == Direcao.NORTE:
             spr = pygame.Surface((w, h), pygame.SRCALPHA)
             pygame.draw.rect(spr, cor, spr.get_rect(), border_radius=4)
             cor_jan = (200, 220, 255, 180)
             pygame.draw.rect(spr, cor_jan, (3, h * 0.7, w - 6, h * 0.25), border_radius=2)
             pygame.draw.rect(spr, cor_jan, (3, 3, w - 6, h * 0.3), border_radius=2)
+            if freando:
+                pygame.draw.rect(spr, (255, 100, 100), (2, 1, 6, 3))
+                pygame.draw.rect(spr, (255, 100, 100), (w - 8, 1, 6, 3))
+            pygame.draw.circle(spr, (255, 255, 200), (8, h - 5), 3)
+            pygame.draw.circle(spr, (255, 255, 200), (w - 8, h - 5), 3)
         else:
             spr = pygame.Surface((h, w), pygame.SRCALPHA)
             pygame.draw.rect(spr, cor, spr.get_rect(), border_radius=4)
             cor_jan = (200, 220, 255, 180)
             pygame.draw.rect(spr, cor_jan, (w * 0.7, 3, w * 0.25, h - 6), border_radius=2)
             pygame.draw.rect(spr, cor_jan, (3, 3, w * 0.3, h - 6), border_radius=2)
-        self._sprite_cache[key] = spr
-        return spr
-
-    def desenhar_veiculo(self, tela: pygame.Surface, veiculo: Veiculo) -> None:
-        if veiculo.direcao == Direcao.NORTE:
-            spr = self._sprite_veiculo(veiculo.direcao, veiculo.cor, veiculo.largura, veiculo.altura)
-            rect = spr.get_rect(center=(int(veiculo.posicao[0]), int(veiculo.posicao[1])))
-            tela.blit(spr, rect)
-            if veiculo.aceleracao_atual < -0.1:
-                pygame.draw.rect(tela, (255, 100, 100), (rect.x + 2, rect.y + 1, 6, 3))
-                pygame.draw.rect(tela, (255, 100, 100), (rect.right - 8, rect.y + 1, 6, 3))
-            pygame.draw.circle(tela, (255, 255, 200), (rect.x + 8, rect.bottom - 5), 3)
-            pygame.draw.circle(tela, (255, 255, 200), (rect.right - 8, rect.bottom - 5), 3)
-        else:
-            spr = self._sprite_veiculo(veiculo.direcao, veiculo.cor, veiculo.largura, veiculo.altura)
-            rect = spr.get_rect(center=(int(veiculo.posicao[0]), int(veiculo.posicao[1])))
-            tela.blit(spr, rect)
-            if veiculo.aceleracao_atual < -0.1:
-                pygame.draw.rect(tela, (255, 100, 100), (rect.x + 1, rect.y + 2, 3, 6))
-                pygame.draw.rect(tela, (255, 100, 100), (rect.x + 1, rect.bottom - 8, 3, 6))
-            pygame.draw.circle(tela, (255, 255, 200), (rect.right - 5, rect.y + 8), 3)
-            pygame.draw.circle(tela, (255, 255, 200), (rect.right - 5, rect.bottom - 8), 3)
+            if freando:
+                pygame.draw.rect(spr, (255, 100, 100), (1, 2, 3, 6))
+                pygame.draw.rect(spr, (255, 100, 100), (1, w - 8, 3, 6))
+            pygame.draw.circle(spr, (255, 255, 200), (h - 5, 8), 3)
+            pygame.draw.circle(spr, (255, 255, 200), (h - 5, w - 8), 3)
+        # OTIMIZAÇÃO: no formato de pixel da tela (set_mode já foi chamado no __init__),
+        # o blit não precisa converter pixel a pixel a cada frame
+        spr = spr.convert_alpha()
+        # metades guardadas junto do sprite: o canto é calculado sem criar um Rect por frame
+        entrada = self._sprite_cache[key] = (spr, spr.get_width() // 2, spr.get_height() // 2)
+        return entrada
+
+    def _sprite_e_posicao_veiculo(self, veiculo: Veiculo) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        spr, meia_w, meia_h = self._sprite_veiculo(veiculo.direcao, veiculo.cor, veiculo.aceleracao_atual < -0.1,
+                                                   veiculo.largura, veiculo.altura)
+        # mesmo canto de spr.get_rect(center=(int(x), int(y)))
+        return spr, (int(veiculo.posicao[0]) - meia_w, int(veiculo.posicao[1]) - meia_h)
+
+    def desenhar_veiculos(self, tela: pygame.Surface, veiculos: List[Veiculo]) -> None:
+        """Desenha a frota inteira com um único `blits` (uma chamada C em vez de N `blit`)."""
+        tela.blits([self._sprite_e_posicao_veiculo(v) for v in veiculos], doreturn=False)
 
         if CONFIG.MOSTRAR_INFO_VEICULO:
-            self._desenhar_info_debug_veiculo(tela, veiculo)
+            # OTIMIZAÇÃO: o texto é ilegível se refeito a cada frame; refaz a cada _QUADROS_ATUALIZACAO_DEBUG
+            # frames (limpar o dict também descarta veículos que já saíram)
+            self._quadros_debug += 1
+            if self._quadros_debug >= _QUADROS_ATUALIZACAO_DEBUG:
+                self._quadros_debug = 0
+                self._debug_por_veiculo.clear()
+            for veiculo in veiculos:
+                self._desenhar_info_debug_veiculo(tela, veiculo)
 
     def _desenhar_info_debug_veiculo(self, tela: pygame.Surface, veiculo: Veiculo) -> None:
-        fonte = pygame.font.SysFont('Arial', 10)
+        superficie_texto = self._debug_por_veiculo.get(veiculo.id)
+        if superficie_texto is None:
+            superficie_texto = self._debug_por_veiculo[veiculo.id] = self._render_info_debug_veiculo(veiculo)
+        tela.blit(superficie_texto, (veiculo.posicao[0] - 20, veiculo.posicao[1] - 25))
+
+    def _render_info_debug_veiculo(self, veiculo: Veiculo) -> pygame.Surface:
+        fonte = self.fontes['debug_veiculo']
         aguardando = ""
         if veiculo.aguardando_semaforo:
             aguardando = "🔴"
         elif veiculo.veiculo_frente and veiculo.distancia_veiculo_frente < CONFIG.DISTANCIA_REACAO:
             aguardando = "🚗"
         texto = f"V:{veiculo.velocidade:.1f} ID:{veiculo.id} {aguardando}"
-        superficie_texto = fonte.render(texto, True, CONFIG.BRANCO)
-        tela.blit(superficie_texto, (veiculo.posicao[0] - 20, veiculo.posicao[1] - 25))
+        cache = self._texto_debug_cache
+        superficie_texto = cache.get(texto)
+        if superficie_texto is None:
+            superficie_texto = fonte.render(texto, True, CONFIG.BRANCO)
+            cache[texto] = superficie_texto
+            if len(cache) > _MAX_TEXTO_DEBUG_CACHE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(texto)
+        return superficie_texto
 
     # ========================================
     # RENDERIZAÇÃO DE SEMÁFOROS
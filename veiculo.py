@@ -10,12 +10,72 @@ from configuracao import CONFIG, Direcao, EstadoSemaforo
 from semaforo import Semaforo
 
 
+# Margem além da borda da tela a partir da qual o veículo é desativado
+_MARGEM_SAIDA_TELA = 150
+
+# (altura_a + altura_b) / 2 entre dois veículos da mesma faixa: todos têm altura ALTURA_VEICULO
+_SOMA_MEIOS_COMPRIMENTOS = CONFIG.ALTURA_VEICULO
+
+# OTIMIZAÇÃO: só as constantes cinemáticas lidas por veículo a cada frame (atualizar,
+# car-following, semáforo) são copiadas no import; ficam fixas a partir daí (ver
+# configuracao.py). Geometria de faixa e grade e os demais valores continuam lidos do CONFIG.
+_ACELERACAO_VEICULO = CONFIG.ACELERACAO_VEICULO
+_DESACELERACAO_VEICULO = CONFIG.DESACELERACAO_VEICULO
+_DESACELERACAO_EMERGENCIA = CONFIG.DESACELERACAO_EMERGENCIA
+_VELOCIDADE_MIN_VEICULO = CONFIG.VELOCIDADE_MIN_VEICULO
+_VELOCIDADE_MAX_VEICULO = CONFIG.VELOCIDADE_MAX_VEICULO
+_DISTANCIA_REACAO = CONFIG.DISTANCIA_REACAO
+_DISTANCIA_MIN_VEICULO = CONFIG.DISTANCIA_MIN_VEICULO
+
+# Sentinela de "sem alvo" nas distâncias. OTIMIZAÇÃO: um único objeto criado no import;
+# float('inf') custava uma chamada por uso. Continua infinito: nenhuma comparação muda.
+_INFINITO = float('inf')
+
+# Cores congeladas numa tupla no import; o sorteio é um randrange indexado (consome o
+# `random` global igual a random.choice, então execuções com random.seed() não mudam)
+_CORES = tuple(CONFIG.CORES_VEICULO)
+
+
+def _distancia_ate_proxima_linha_grade(pos: float, origem: float, espacamento: float, n: int) -> float:
+    """
+    Distância de `pos` até a primeira coordenada `origem + k*espacamento >= pos` (0 <= k < n),
+    ou 9999.0 se não houver. OTIMIZAÇÃO: O(1) por divisão em vez de percorrer as n linhas
+    da grade (que muda em tempo de execução, por isso nada é pré-calculado no import).
+    """
+    k = max(0, math.ceil((pos - origem) / espacamento))
+    # corrige o arredondamento da divisão para bater com a comparação direta
+    if k > 0 and origem + (k - 1) * espacamento >= pos:
+        k -= 1
+    elif origem + k * espacamento < pos:
+        k += 1
+    if k >= n:
+        return 9999.0
+    return origem + k * espacamento - pos
+
+
 class Veiculo:
     """Representa um veículo na simulação com física e comportamento realista - MÃO ÚNICA."""
 
+    # OTIMIZAÇÃO: sem __dict__ por instância (menos memória, acesso a atributo por slot).
+    # Inclui os campos que a MalhaViaria grava nos veículos (_was_moving, _stop_count).
+    __slots__ = (
+        'id', 'direcao', 'posicao',
+        'id_cruzamento_origem', 'id_cruzamento_atual', 'cor', 'ativo',
+        'largura', 'altura',
+        'velocidade', 'velocidade_desejada', 'aceleracao_atual',
+        'parado', 'no_cruzamento', 'passou_semaforo', 'aguardando_semaforo', 'em_desaceleracao',
+        'semaforo_proximo', 'ultimo_semaforo_processado', 'distancia_semaforo', 'pode_passar_amarelo',
+        'veiculo_frente', 'distancia_veiculo_frente',
+        'indice_faixa', '_via', '_leader_cache', '_follower_cache', '_lane_cooldown_frames',
+        'tempo_viagem', 'tempo_parado', 'paradas_totais', 'distancia_percorrida',
+        '_eixo', '_eixo_lat', '_limite_saida', '_meia_altura',
+        '_was_moving', '_stop_count',
+    )
+
     _contador_id = 0
 
-    def __init__(self, direcao: Direcao, posicao: Tuple[float, float], id_cruzamento_origem: Tuple[int, int]):
+    def __init__(self, direcao: Direcao, posicao: Tuple[float, float], id_cruzamento_origem: Tuple[int, int],
+                 indice_faixa: int = 0):
         if direcao not in CONFIG.DIRECOES_PERMITIDAS:
             raise ValueError(f"Direção {direcao} não permitida. Use apenas {CONFIG.DIRECOES_PERMITIDAS}")
 
@@ -24,15 +84,22 @@ class Veiculo:
 
         self.direcao = direcao
         self.posicao = list(posicao)
-        self.posicao_inicial = list(posicao)
+        # OTIMIZAÇÃO: índices do eixo longitudinal/lateral em `posicao` (NORTE anda em y,
+        # LESTE em x); substituem o `if direcao == ...` nos cálculos por eixo
+        self._eixo = 1 if direcao == Direcao.NORTE else 0
+        self._eixo_lat = 1 - self._eixo
+        self._limite_saida = (CONFIG.ALTURA_TELA if direcao == Direcao.NORTE else CONFIG.LARGURA_TELA) \
+            + _MARGEM_SAIDA_TELA
         self.id_cruzamento_origem = id_cruzamento_origem
         self.id_cruzamento_atual = id_cruzamento_origem
-        self.cor = random.choice(CONFIG.CORES_VEICULO)
+        self.cor = _CORES[random.randrange(len(_CORES))]
         self.ativo = True
 
         # Dimensões
         self.largura = CONFIG.LARGURA_VEICULO
         self.altura = CONFIG.ALTURA_VEICULO
+        # meio comprimento (ao longo do eixo de movimento), usado no teste de colisão futura
+        self._meia_altura = self.altura // 2
 
         # Física
         self.velocidade = 0.0
@@ -49,15 +116,20 @@ class Veiculo:
         # Semáforo
         self.semaforo_proximo = None
         self.ultimo_semaforo_processado = None
-        self.distancia_semaforo = float('inf')
+        self.distancia_semaforo = _INFINITO
         self.pode_passar_amarelo = False
 
         # Car-following
         self.veiculo_frente = None
-        self.distancia_veiculo_frente = float('inf')
-
-        # Lanes
-        self.indice_faixa: int = getattr(self, "indice_faixa", 0)
+        self.distancia_veiculo_frente = _INFINITO
+
+        # Lanes (o clamp é feito só aqui; a troca de faixa só escolhe alvos válidos)
+        self.indice_faixa: int = max(0, min(indice_faixa, CONFIG.FAIXAS_POR_VIA - 1))
+        # OTIMIZAÇÃO: a via não muda durante a vida do veículo (a lateral só é ajustada
+        # para faixas da mesma via)
+        self._via: int = self._via_idx()
+        # a lateral só é escrita aqui e na troca de faixa, sempre no centro da faixa
+        self.posicao[self._eixo_lat] = self._lane_center_coord(direcao, self._via, self.indice_faixa)
         self._leader_cache = None
         self._follower_cache = None
         self._lane_cooldown_frames = 0  # cooldown MOBIL-lite
@@ -67,15 +139,11 @@ class Veiculo:
         self.tempo_parado = 0
         self.paradas_totais = 0
         self.distancia_percorrida = 0.0
-
-        self._atualizar_rect()
+        # contagem de paradas feita pela MalhaViaria
+        self._was_moving = True
+        self._stop_count = 0
 
     # ------------- helpers de faixa -------------
-    def _garantir_campos_lane(self):
-        if not hasattr(self, "indice_faixa"):
-            self.indice_faixa = 0
-        self.indice_faixa = max(0, min(self.indice_faixa, CONFIG.FAIXAS_POR_VIA - 1))
-
     def _via_idx(self) -> int:
         if self.direcao == Direcao.LESTE:
             idx = round((self.posicao[1] - CONFIG.POSICAO_INICIAL_Y) / CONFIG.ESPACAMENTO_VERTICAL)
@@ -84,38 +152,35 @@ class Veiculo:
             idx = round((self.posicao[0] - CONFIG.POSICAO_INICIAL_X) / CONFIG.ESPACAMENTO_HORIZONTAL)
             return max(0, min(idx, CONFIG.COLUNAS_GRADE - 1))
 
-    def _lane_center_coord(self, direcao: Direcao, faixa: int) -> float:
+    @staticmethod
+    def _lane_center_coord(direcao: Direcao, via: int, faixa: int) -> float:
+        """Coordenada lateral do centro da faixa; também usada pelo spawn do Cruzamento."""
         faixa = max(0, min(faixa, CONFIG.FAIXAS_POR_VIA - 1))
         if direcao == Direcao.LESTE:
-            y_road = CONFIG.POSICAO_INICIAL_Y + self._via_idx() * CONFIG.ESPACAMENTO_VERTICAL
+            y_road = CONFIG.POSICAO_INICIAL_Y + via * CONFIG.ESPACAMENTO_VERTICAL
             return y_road - CONFIG.LARGURA_RUA / 2 + (faixa + 0.5) * CONFIG.LARGURA_FAIXA
         else:
-            x_road = CONFIG.POSICAO_INICIAL_X + self._via_idx() * CONFIG.ESPACAMENTO_HORIZONTAL
+            x_road = CONFIG.POSICAO_INICIAL_X + via * CONFIG.ESPACAMENTO_HORIZONTAL
             return x_road - CONFIG.LARGURA_RUA / 2 + (faixa + 0.5) * CONFIG.LARGURA_FAIXA
 
     def _mesma_via_mesma_faixa(self, outro: 'Veiculo', faixa: int) -> bool:
         if self.direcao != outro.direcao:
             return False
-        if getattr(outro, "indice_faixa", 0) != faixa:
+        if outro.indice_faixa != faixa:
             return False
-        return self._via_idx() == outro._via_idx()
+        return self._via == outro._via
 
     # ------------- retângulo de colisão -------------
-    def _atualizar_rect(self) -> None:
+    # A física não usa caixas 2D (a colisão futura é o teste 1D de verificar_colisao_futura);
+    # nenhum Rect é mantido por frame.
+    @property
+    def rect(self) -> pygame.Rect:
+        """Rect de colisão na posição atual, construído sob demanda (LESTE anda deitado)."""
         if self.direcao == Direcao.NORTE:
-            self.rect = pygame.Rect(
-                self.posicao[0] - self.largura // 2,
-                self.posicao[1] - self.altura // 2,
-                self.largura,
-                self.altura
-            )
+            w, h = self.largura, self.altura
         else:
-            self.rect = pygame.Rect(
-                self.posicao[0] - self.altura // 2,
-                self.posicao[1] - self.largura // 2,
-                self.altura,
-                self.largura
-            )
+            w, h = self.altura, self.largura
+        return pygame.Rect(self.posicao[0] - w // 2, self.posicao[1] - h // 2, w, h)
 
     def resetar_controle_semaforo(self, novo_cruzamento_id: Optional[Tuple[int, int]] = None) -> None:
         if novo_cruzamento_id and novo_cruzamento_id != self.id_cruzamento_atual:
@@ -124,79 +189,79 @@ class Veiculo:
             self.aguardando_semaforo = False
             self.pode_passar_amarelo = False
             self.semaforo_proximo = None
-            self.distancia_semaforo = float('inf')
+            self.distancia_semaforo = _INFINITO
 
     # ------------- colisão futura -------------
-    def verificar_colisao_futura(self, todos_veiculos: List['Veiculo']) -> bool:
+    def verificar_colisao_futura(self) -> bool:
         # OTIMIZAÇÃO: Checa apenas o veículo da frente já identificado (O(1))
         # em vez de iterar sobre todos os veículos (O(N))
         if not self.veiculo_frente or not self.veiculo_frente.ativo:
             return False
 
-        dx, dy = 0, 0
-        if self.direcao == Direcao.NORTE:
-            dy = self.velocidade + CONFIG.DISTANCIA_MIN_VEICULO / 2
-        else:
-            dx = self.velocidade + CONFIG.DISTANCIA_MIN_VEICULO / 2
-        
-        posicao_futura = [self.posicao[0] + dx, self.posicao[1] + dy]
-
-        if self.direcao == Direcao.NORTE:
-            rect_futuro = pygame.Rect(
-                posicao_futura[0] - self.largura // 2,
-                posicao_futura[1] - self.altura // 2,
-                self.largura, self.altura
-            )
-        else:
-            rect_futuro = pygame.Rect(
-                posicao_futura[0] - self.altura // 2,
-                posicao_futura[1] - self.largura // 2,
-                self.altura, self.largura
-            )
-
-        rect_outro_expandido = self.veiculo_frente.rect.inflate(10, 10)
-        return rect_futuro.colliderect(rect_outro_expandido)
+        # OTIMIZAÇÃO: equivalente a rect_futuro.colliderect(frente.rect.inflate(10, 10)) sem
+        # criar Rects: sobreposição lateral e longitudinal testadas por eixo. O líder é da
+        # mesma via, mas após uma troca de faixa (MOBIL-lite) neste frame ainda pode ser o da
+        # faixa antiga; o teste lateral o descarta se LARGURA_FAIXA o afastar o bastante.
+        # int() trunca como o construtor do Rect; o comprimento da caixa é a altura.
+        frente = self.veiculo_frente
+        eixo_lat = self._eixo_lat
+        if abs(self.posicao[eixo_lat] - frente.posicao[eixo_lat]) >= (self.largura + frente.largura + 10) / 2:
+            return False
+        eixo = self._eixo
+        a0 = int(self.posicao[eixo] + (self.velocidade + _DISTANCIA_MIN_VEICULO / 2) - self._meia_altura)
+        b0 = int(frente.posicao[eixo] - frente._meia_altura)
+        return a0 < b0 + frente.altura + 5 and b0 - 5 < a0 + self.altura
 
     # ------------- car-following + MOBIL-lite -------------
-    def processar_todos_veiculos(self, todos_veiculos: List['Veiculo']) -> None:
+    def _vizinhos_na_faixa(self, faixa: int, todos_veiculos: List['Veiculo'], malha=None) -> List['Veiculo']:
+        """Candidatos da mesma via e faixa: o balde da malha (O(k)) ou, sem malha, filtro O(N)."""
+        if malha is not None:
+            return malha.veiculos_na_faixa(self.direcao, self._via, faixa)
+        return [o for o in todos_veiculos if self._mesma_via_mesma_faixa(o, faixa)]
+
+    def processar_todos_veiculos(self, todos_veiculos: List['Veiculo'], malha=None) -> None:
         """
         Usa caches (líder/seguidor por faixa) quando presentes (O(1));
-        fallback O(N) apenas se necessário. Aplica decisão de mudança de faixa
-        (MOBIL-lite com gap acceptance) apenas quando há ganho de velocidade.
+        fallback apenas se necessário, varrendo só o balde (direção, via, faixa)
+        da malha. Aplica decisão de mudança de faixa (MOBIL-lite com gap
+        acceptance) apenas quando há ganho de velocidade.
         """
-        self._garantir_campos_lane()
-
-        leader = getattr(self, "_leader_cache", None)
+        leader = self._leader_cache
         if leader is not None and leader.ativo and self._mesma_via_mesma_faixa(leader, self.indice_faixa):
             self.veiculo_frente = leader
-            self.distancia_veiculo_frente = self._calcular_distancia_para_veiculo(leader)
-            self.processar_veiculo_frente(leader)
+            # OTIMIZAÇÃO: mesma conta de _calcular_distancia_para_veiculo, sem repetir os
+            # testes de sentido e via/faixa que acabaram de passar
+            eixo = self._eixo
+            delta = leader.posicao[eixo] - self.posicao[eixo]
+            self.distancia_veiculo_frente = max(0, delta - _SOMA_MEIOS_COMPRIMENTOS) if delta > 0 else _INFINITO
+            self.processar_veiculo_frente(leader, self.distancia_veiculo_frente)
         else:
             # fallback simples (mesma via e mesma faixa)
             veiculo_mais_prox = None
-            distancia_min = float('inf')
-            for outro in todos_veiculos:
-                if outro.id == self.id or not outro.ativo:
+            distancia_min = _INFINITO
+            eixo = self._eixo
+            pos = self.posicao[eixo]
+            for outro in self._vizinhos_na_faixa(self.indice_faixa, todos_veiculos, malha):
+                if outro is self or not outro.ativo:
                     continue
-                if self.direcao != outro.direcao or not self._mesma_via_mesma_faixa(outro, self.indice_faixa):
-                    continue
-                if self.direcao == Direcao.NORTE and outro.posicao[1] > self.posicao[1]:
-                    d = outro.posicao[1] - self.posicao[1]
-                elif self.direcao == Direcao.LESTE and outro.posicao[0] > self.posicao[0]:
-                    d = outro.posicao[0] - self.posicao[0]
-                else:
+                d = outro.posicao[eixo] - pos
+                if d <= 0:
                     continue
                 if d < distancia_min:
                     distancia_min, veiculo_mais_prox = d, outro
             if veiculo_mais_prox:
                 self.veiculo_frente = veiculo_mais_prox
                 self.distancia_veiculo_frente = distancia_min
-                self.processar_veiculo_frente(veiculo_mais_prox)
+                # mesma conta de _calcular_distancia_para_veiculo (mesma via/faixa e à frente já garantidos)
+                self.processar_veiculo_frente(
+                    veiculo_mais_prox,
+                    max(0, distancia_min - _SOMA_MEIOS_COMPRIMENTOS)
+                )
             else:
                 self.veiculo_frente = None
-                self.distancia_veiculo_frente = float('inf')
+                self.distancia_veiculo_frente = _INFINITO
                 if not self.aguardando_semaforo:
-                    self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO * 0.3
+                    self.aceleracao_atual = _ACELERACAO_VEICULO * 0.3
 
         # ---- MOBIL-lite: tentativa de mudança de faixa (se houver ganho) ----
         if self._lane_cooldown_frames > 0:
@@ -205,7 +270,7 @@ class Veiculo:
         # condição de “benefício”: estamos limitados pelo líder e relativamente perto
         limitado_por_lider = (
             self.veiculo_frente is not None and
-            self.distancia_veiculo_frente < CONFIG.DISTANCIA_REACAO and
+            self.distancia_veiculo_frente < _DISTANCIA_REACAO and
             (self.veiculo_frente.velocidade + 1e-3) < (self.velocidade_desejada * 0.9)
         )
         if not limitado_por_lider:
@@ -223,49 +288,40 @@ class Veiculo:
             candidatos.append(self.indice_faixa - 1)
 
         for alvo in candidatos:
-            if self.pode_mudar_faixa(alvo, todos_veiculos):
+            if self.pode_mudar_faixa(alvo, todos_veiculos, malha):
                 # aplica troca “instantânea” (simples e barato)
+                faixa_antiga = self.indice_faixa
                 self.indice_faixa = alvo
+                if malha is not None:
+                    malha.registrar_troca_faixa(self, faixa_antiga)
                 self._lane_cooldown_frames = int(0.75 * CONFIG.FPS)  # ~0.75s
                 # “teleporta” para o centro da faixa (lateral)
-                if self.direcao == Direcao.LESTE:
-                    self.posicao[1] = self._lane_center_coord(Direcao.LESTE, self.indice_faixa)
-                else:
-                    self.posicao[0] = self._lane_center_coord(Direcao.NORTE, self.indice_faixa)
+                self.posicao[self._eixo_lat] = self._lane_center_coord(self.direcao, self._via, self.indice_faixa)
                 break
 
-    def pode_mudar_faixa(self, faixa_alvo: int, todos_veiculos: List['Veiculo']) -> bool:
+    def pode_mudar_faixa(self, faixa_alvo: int, todos_veiculos: List['Veiculo'], malha=None) -> bool:
         """Gap acceptance simplificado: checa líder e seguidor da faixa alvo e ganho esperado."""
         faixa_alvo = max(0, min(faixa_alvo, CONFIG.FAIXAS_POR_VIA - 1))
 
         # encontra líder e seguidor na faixa alvo (mesma via)
         leader_alvo = None
         follower_alvo = None
-        d_leader = float('inf')
-        d_follower = float('inf')
+        d_leader = _INFINITO
+        d_follower = _INFINITO
 
-        for outro in todos_veiculos:
-            if not outro.ativo or outro.id == self.id:
-                continue
-            if self.direcao != outro.direcao or not self._mesma_via_mesma_faixa(outro, faixa_alvo):
+        eixo = self._eixo
+        pos = self.posicao[eixo]
+        for outro in self._vizinhos_na_faixa(faixa_alvo, todos_veiculos, malha):
+            if not outro.ativo or outro is self:
                 continue
 
-            if self.direcao == Direcao.NORTE:
-                delta = outro.posicao[1] - self.posicao[1]
-                if delta > 0:
-                    if delta < d_leader:
-                        d_leader, leader_alvo = delta, outro
-                else:
-                    if -delta < d_follower:
-                        d_follower, follower_alvo = -delta, outro
+            delta = outro.posicao[eixo] - pos
+            if delta > 0:
+                if delta < d_leader:
+                    d_leader, leader_alvo = delta, outro
             else:
-                delta = outro.posicao[0] - self.posicao[0]
-                if delta > 0:
-                    if delta < d_leader:
-                        d_leader, leader_alvo = delta, outro
-                else:
-                    if -delta < d_follower:
-                        d_follower, follower_alvo = -delta, outro
+                if -delta < d_follower:
+                    d_follower, follower_alvo = -delta, outro
 
         # gaps mínimos
         if d_leader < CONFIG.DISTANCIA_SEGURANCA:
@@ -283,28 +339,14 @@ class Veiculo:
     def _distancia_ate_proximo_cruzamento(self) -> float:
         """Distância longitudinal até o próximo cruzamento à frente (aprox.)."""
         if self.direcao == Direcao.LESTE:
-            # próximo X de cruzamento na mesma linha
-            via_y_idx = self._via_idx()
-            y_road = CONFIG.POSICAO_INICIAL_Y + via_y_idx * CONFIG.ESPACAMENTO_VERTICAL
             # próximos X: centro de cada coluna
-            x = self.posicao[0]
-            melhor = float('inf')
-            for c in range(CONFIG.COLUNAS_GRADE):
-                x_c = CONFIG.POSICAO_INICIAL_X + c * CONFIG.ESPACAMENTO_HORIZONTAL
-                if x_c >= x:
-                    melhor = min(melhor, x_c - x)
-            return melhor if melhor != float('inf') else 9999.0
-        else:
-            # próximo Y de cruzamento na mesma coluna
-            via_x_idx = self._via_idx()
-            x_road = CONFIG.POSICAO_INICIAL_X + via_x_idx * CONFIG.ESPACAMENTO_HORIZONTAL
-            y = self.posicao[1]
-            melhor = float('inf')
-            for l in range(CONFIG.LINHAS_GRADE):
-                y_l = CONFIG.POSICAO_INICIAL_Y + l * CONFIG.ESPACAMENTO_VERTICAL
-                if y_l >= y:
-                    melhor = min(melhor, y_l - y)
-            return melhor if melhor != float('inf') else 9999.0
+            return _distancia_ate_proxima_linha_grade(
+                self.posicao[0], CONFIG.POSICAO_INICIAL_X, CONFIG.ESPACAMENTO_HORIZONTAL, CONFIG.COLUNAS_GRADE
+            )
+        # próximos Y: centro de cada linha
+        return _distancia_ate_proxima_linha_grade(
+            self.posicao[1], CONFIG.POSICAO_INICIAL_Y, CONFIG.ESPACAMENTO_VERTICAL, CONFIG.LINHAS_GRADE
+        )
 
     # ------------- atualização -------------
     def atualizar(self, dt: float = 1.0, todos_veiculos: List['Veiculo'] = None, malha=None) -> None:
@@ -326,47 +368,34 @@ class Veiculo:
         self.velocidade += self.aceleracao_atual * dt
 
         # limite de velocidade com fator local (CAOS)
-        fator = malha.obter_fator_caos(self) if malha is not None else 1.0
-        vmax_local = CONFIG.VELOCIDADE_MAX_VEICULO * fator
-        self.velocidade = max(CONFIG.VELOCIDADE_MIN_VEICULO, min(vmax_local, self.velocidade))
+        fator = malha.obter_fator_caos(self) if malha is not None and malha.caos_ativo else 1.0
+        vmax_local = _VELOCIDADE_MAX_VEICULO * fator
+        self.velocidade = max(_VELOCIDADE_MIN_VEICULO, min(vmax_local, self.velocidade))
 
         # colisão futura
         if todos_veiculos and self.velocidade > 0:
-            if self.verificar_colisao_futura(todos_veiculos):
+            if self.verificar_colisao_futura():
                 self.velocidade = 0
                 self.aceleracao_atual = 0
-                self._atualizar_rect()
                 return
 
-        # movimento
-        dx, dy = 0, 0
-        if self.direcao == Direcao.NORTE:
-            dy = self.velocidade
-            # corrige lateral para o centro da faixa
-            self.posicao[0] = self._lane_center_coord(Direcao.NORTE, self.indice_faixa)
-        else:
-            dx = self.velocidade
-            self.posicao[1] = self._lane_center_coord(Direcao.LESTE, self.indice_faixa)
-
-        self.posicao[0] += dx
-        self.posicao[1] += dy
-        self.distancia_percorrida += math.sqrt(dx ** 2 + dy ** 2)
-
-        self._atualizar_rect()
+        # movimento só no eixo longitudinal.
+        # PERF: a lateral já está no centro da faixa (fixada no __init__ e na troca de faixa)
+        self.posicao[self._eixo] += self.velocidade
+        # movimento alinhado a um eixo e velocidade >= 0: o deslocamento é a própria velocidade
+        self.distancia_percorrida += self.velocidade
 
-        # saída da tela (margem um pouco maior para evitar sumiços prematuros)
-        margem = 150
-        if (self.posicao[0] < -margem or
-                self.posicao[0] > CONFIG.LARGURA_TELA + margem or
-                self.posicao[1] < -margem or
-                self.posicao[1] > CONFIG.ALTURA_TELA + margem):
+        # saída da tela (margem um pouco maior para evitar sumiços prematuros).
+        # PERF: velocidade >= VELOCIDADE_MIN_VEICULO (0) e o movimento é só em +x/+y,
+        # então o veículo só pode sair pela borda à frente: uma comparação basta.
+        if self.posicao[self._eixo] > self._limite_saida:
             self.ativo = False
 
     # ------------- semáforo e car-following -------------
     def processar_semaforo(self, semaforo: Semaforo, posicao_parada: Tuple[float, float]) -> None:
         if not semaforo:
-            if not self.veiculo_frente or self.distancia_veiculo_frente > CONFIG.DISTANCIA_REACAO:
-                self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO
+            if not self.veiculo_frente or self.distancia_veiculo_frente > _DISTANCIA_REACAO:
+                self.aceleracao_atual = _ACELERACAO_VEICULO
             return
 
         if self.ultimo_semaforo_processado != semaforo:
@@ -375,8 +404,8 @@ class Veiculo:
             self.pode_passar_amarelo = False
 
         if self.passou_semaforo:
-            if not self.veiculo_frente or self.distancia_veiculo_frente > CONFIG.DISTANCIA_REACAO:
-                self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO
+            if not self.veiculo_frente or self.distancia_veiculo_frente > _DISTANCIA_REACAO:
+                self.aceleracao_atual = _ACELERACAO_VEICULO
             return
 
         self.distancia_semaforo = self._calcular_distancia_ate_ponto(posicao_parada)
@@ -384,14 +413,14 @@ class Veiculo:
         if self._passou_da_linha(posicao_parada):
             self.passou_semaforo = True
             self.aguardando_semaforo = False
-            if not self.veiculo_frente or self.distancia_veiculo_frente > CONFIG.DISTANCIA_REACAO:
-                self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO
+            if not self.veiculo_frente or self.distancia_veiculo_frente > _DISTANCIA_REACAO:
+                self.aceleracao_atual = _ACELERACAO_VEICULO
             return
 
         if semaforo.estado == EstadoSemaforo.VERDE:
             self.aguardando_semaforo = False
-            if not self.veiculo_frente or self.distancia_veiculo_frente > CONFIG.DISTANCIA_REACAO:
-                self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO
+            if not self.veiculo_frente or self.distancia_veiculo_frente > _DISTANCIA_REACAO:
+                self.aceleracao_atual = _ACELERACAO_VEICULO
 
         elif semaforo.estado == EstadoSemaforo.AMARELO:
             if self.pode_passar_amarelo:
@@ -416,61 +445,56 @@ class Veiculo:
             else:
                 self._aplicar_frenagem_para_parada(self.distancia_semaforo)
 
-    def processar_veiculo_frente(self, veiculo_frente: 'Veiculo') -> None:
+    def processar_veiculo_frente(self, veiculo_frente: 'Veiculo', distancia: Optional[float] = None) -> None:
+        """Car-following; `distancia` (para-choque a para-choque) evita recalcular o que a busca do líder já obteve."""
         if not veiculo_frente:
             return
-        distancia = self._calcular_distancia_para_veiculo(veiculo_frente)
-        if distancia < CONFIG.DISTANCIA_MIN_VEICULO:
+        if distancia is None:
+            distancia = self._calcular_distancia_para_veiculo(veiculo_frente)
+        if distancia < _DISTANCIA_MIN_VEICULO:
             self.velocidade = 0
             self.aceleracao_atual = 0
             return
 
-        if distancia < CONFIG.DISTANCIA_REACAO:
+        if distancia < _DISTANCIA_REACAO:
             velocidade_segura = self._calcular_velocidade_segura(distancia, veiculo_frente.velocidade)
             if self.velocidade > velocidade_segura:
-                if distancia < CONFIG.DISTANCIA_MIN_VEICULO * 1.5:
-                    self.aceleracao_atual = -CONFIG.DESACELERACAO_EMERGENCIA
+                if distancia < _DISTANCIA_MIN_VEICULO * 1.5:
+                    self.aceleracao_atual = -_DESACELERACAO_EMERGENCIA
                 else:
-                    self.aceleracao_atual = -CONFIG.DESACELERACAO_VEICULO
+                    self.aceleracao_atual = -_DESACELERACAO_VEICULO
             elif self.velocidade < velocidade_segura * 0.9:
-                self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO * 0.3
+                self.aceleracao_atual = _ACELERACAO_VEICULO * 0.3
             else:
                 self.aceleracao_atual = 0
         else:
             if not self.aguardando_semaforo:
-                self.aceleracao_atual = CONFIG.ACELERACAO_VEICULO
+                self.aceleracao_atual = _ACELERACAO_VEICULO
 
     # ------------- utilidades -------------
     def _calcular_distancia_ate_ponto(self, ponto: Tuple[float, float]) -> float:
-        if self.direcao == Direcao.NORTE:
-            return max(0, ponto[1] - self.posicao[1])
-        elif self.direcao == Direcao.LESTE:
-            return max(0, ponto[0] - self.posicao[0])
-        return float('inf')
+        eixo = self._eixo
+        return max(0, ponto[eixo] - self.posicao[eixo])
 
     def _passou_da_linha(self, ponto: Tuple[float, float]) -> bool:
         margem = 5
-        if self.direcao == Direcao.NORTE:
-            return self.posicao[1] > ponto[1] + margem
-        elif self.direcao == Direcao.LESTE:
-            return self.posicao[0] > ponto[0] + margem
-        return False
+        eixo = self._eixo
+        return self.posicao[eixo] > ponto[eixo] + margem
 
     def _calcular_distancia_para_veiculo(self, outro: 'Veiculo') -> float:
         if self.direcao != outro.direcao:
-            return float('inf')
+            return _INFINITO
+        eixo = self._eixo
+        delta = outro.posicao[eixo] - self.posicao[eixo]
+        # Quem está atrás sai aqui, antes do teste de via/faixa (que é o mais caro)
+        if delta <= 0:
+            return _INFINITO
         if not self._mesma_via_mesma_faixa(outro, self.indice_faixa):
-            return float('inf')
-        dx = outro.posicao[0] - self.posicao[0]
-        dy = outro.posicao[1] - self.posicao[1]
-        if self.direcao == Direcao.NORTE and dy > 0:
-            return max(0, dy - (self.altura + outro.altura) / 2)
-        elif self.direcao == Direcao.LESTE and dx > 0:
-            return max(0, dx - (self.altura + outro.altura) / 2)
-        return float('inf')
+            return _INFINITO
+        return max(0, delta - _SOMA_MEIOS_COMPRIMENTOS)
 
     def _calcular_velocidade_segura(self, distancia: float, velocidade_lider: float) -> float:
-        if distancia < CONFIG.DISTANCIA_MIN_VEICULO:
+        if distancia < _DISTANCIA_MIN_VEICULO:
             return 0
         tempo_reacao = 1.0
         distancia_segura = CONFIG.DISTANCIA_SEGURANCA + velocidade_lider * tempo_reacao
@@ -481,13 +505,13 @@ class Veiculo:
 
     def _aplicar_frenagem_para_parada(self, distancia: float) -> None:
         if distancia < CONFIG.DISTANCIA_PARADA_SEMAFORO:
-            self.aceleracao_atual = -CONFIG.DESACELERACAO_EMERGENCIA
+            self.aceleracao_atual = -_DESACELERACAO_EMERGENCIA
             self.velocidade_desejada = 0
             if distancia < CONFIG.DISTANCIA_PARADA_SEMAFORO / 2:
                 self.velocidade = 0.0
         else:
             if self.velocidade > 0.1 and distancia > 0:
                 desaceleracao_necessaria = (self.velocidade ** 2) / (2 * distancia)
-                self.aceleracao_atual = -min(desaceleracao_necessaria, CONFIG.DESACELERACAO_VEICULO)
+                self.aceleracao_atual = -min(desaceleracao_necessaria, _DESACELERACAO_VEICULO)
             else:
                 self.aceleracao_atual = 0